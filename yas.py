@@ -5,26 +5,274 @@ import sys
 import re
 import csv
 import pickle
+import heapq
+import json
+import struct
+import hashlib
+import time
+import uuid
+import socket
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from datetime import datetime
 from pathlib import Path
+import httplib2
+import requests
+from requests.adapters import HTTPAdapter
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import Request, AuthorizedSession
 from dotenv import load_dotenv
 
+def env_number(name, default, cast=int):
+    """Read a numeric setting from the environment, treating an empty value as unset"""
+    value = os.getenv(name, '').strip()
+    if not value:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        raise ValueError(f"Invalid value for {name}: {value!r} (expected a number)")
+
+# Connection pool shared by every API client in this process, so reconnects keep their sockets
+_shared_adapter = None
+
+def get_shared_adapter(pool_size=10):
+    global _shared_adapter
+    if _shared_adapter is None:
+        _shared_adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    return _shared_adapter
+
+class PooledHttp:
+    """httplib2-compatible transport backed by a keep-alive AuthorizedSession
+    
+    googleapiclient only calls request() and close(), so this lets every client built by
+    _authenticate() reuse the same pooled TLS connections instead of opening its own.
+    """
+    def __init__(self, credentials, adapter, timeout=None):
+        self.credentials = credentials
+        self.timeout = timeout
+        self.session = AuthorizedSession(credentials)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def request(self, uri, method='GET', body=None, headers=None, redirections=5, connection_type=None):
+        # Never follow redirects - resumable uploads answer with 308 Resume Incomplete,
+        # which googleapiclient must see as-is
+        response = self.session.request(
+            method, uri,
+            data=body,
+            headers=headers,
+            timeout=self.timeout,
+            allow_redirects=False
+        )
+        
+        info = dict(response.headers)
+        info['status'] = str(response.status_code)
+        return httplib2.Response(info), response.content
+    
+    def close(self):
+        # The connection pool is shared with other clients, so leave it open
+        pass
+
+# MP4/MOV faststart remux - moves a trailing moov atom in front of the media data
+FASTSTART_EXTENSIONS = ('.mp4', '.mov', '.m4v')
+FASTSTART_CACHE_DIR = './cache/faststart/'
+
+# Atoms that have to be walked to reach the stco/co64 chunk offset tables
+MOOV_CONTAINER_ATOMS = (b'moov', b'trak', b'mdia', b'minf', b'stbl')
+
+def _iter_atoms(f, start, end):
+    """Yield (type, offset, header_size, size) for each atom between start and end"""
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        size, atom_type = struct.unpack('>I4s', f.read(8))
+        header_size = 8
+        
+        if size == 1:
+            size = struct.unpack('>Q', f.read(8))[0]
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        
+        if size < header_size or offset + size > end:
+            raise ValueError(f"Invalid {atom_type!r} atom at offset {offset}")
+        
+        yield atom_type, offset, header_size, size
+        offset += size
+
+def _rebuild_moov_atom(data, relocate, use_co64):
+    """Return a copy of a moov (or child) atom with every chunk offset passed through relocate"""
+    size, atom_type = struct.unpack_from('>I4s', data)
+    header_size = 16 if size == 1 else 8
+    
+    if atom_type in MOOV_CONTAINER_ATOMS:
+        children = []
+        offset = header_size
+        while offset + 8 <= len(data):
+            child_size = struct.unpack_from('>I', data, offset)[0]
+            if child_size == 1:
+                child_size = struct.unpack_from('>Q', data, offset + 8)[0]
+            elif child_size == 0:
+                child_size = len(data) - offset
+            children.append(_rebuild_moov_atom(data[offset:offset + child_size], relocate, use_co64))
+            offset += child_size
+        
+        body = b''.join(children)
+        return struct.pack('>I4s', 8 + len(body), atom_type) + body
+    
+    if atom_type in (b'stco', b'co64'):
+        version_flags = data[header_size:header_size + 4]
+        count = struct.unpack_from('>I', data, header_size + 4)[0]
+        entry_format = 'I' if atom_type == b'stco' else 'Q'
+        offsets = struct.unpack_from(f'>{count}{entry_format}', data, header_size + 8)
+        offsets = [relocate(offset) for offset in offsets]
+        
+        if atom_type == b'stco' and not use_co64:
+            if offsets and max(offsets) > 0xFFFFFFFF:
+                raise OverflowError("Chunk offset no longer fits in a 32-bit stco table")
+            body = version_flags + struct.pack(f'>I{count}I', count, *offsets)
+            return struct.pack('>I4s', 8 + len(body), b'stco') + body
+        
+        body = version_flags + struct.pack(f'>I{count}Q', count, *offsets)
+        return struct.pack('>I4s', 8 + len(body), b'co64') + body
+    
+    return bytes(data)
+
+def _copy_range(src, dst, start, length, chunk_size=1024 * 1024):
+    src.seek(start)
+    while length > 0:
+        chunk = src.read(min(chunk_size, length))
+        if not chunk:
+            raise ValueError("Unexpected end of file while copying")
+        dst.write(chunk)
+        length -= len(chunk)
+
+def needs_faststart(video_path):
+    """Return True if the file's moov atom comes after its first mdat atom"""
+    file_size = os.path.getsize(video_path)
+    moov_offset = None
+    mdat_offset = None
+    
+    with open(video_path, 'rb') as f:
+        for atom_type, offset, _, _ in _iter_atoms(f, 0, file_size):
+            if atom_type == b'moof':
+                # Fragmented files keep their offsets in each fragment - leave them alone
+                return False
+            if atom_type == b'moov' and moov_offset is None:
+                moov_offset = offset
+            elif atom_type == b'mdat' and mdat_offset is None:
+                mdat_offset = offset
+    
+    return moov_offset is not None and mdat_offset is not None and moov_offset > mdat_offset
+
+def faststart_remux(video_path, output_path):
+    """Stream video_path to output_path with the moov atom moved in front of the first mdat
+    
+    Only the moov atom is held in memory. Chunk offsets that point at data which moves
+    are rewritten, and stco tables are upgraded to co64 if an offset outgrows 32 bits.
+    """
+    file_size = os.path.getsize(video_path)
+    
+    with open(video_path, 'rb') as src:
+        atoms = list(_iter_atoms(src, 0, file_size))
+        moov = next(atom for atom in atoms if atom[0] == b'moov')
+        insert_at = next(atom for atom in atoms if atom[0] == b'mdat')[1]
+        _, moov_offset, _, moov_size = moov
+        moov_end = moov_offset + moov_size
+        
+        src.seek(moov_offset)
+        moov_data = src.read(moov_size)
+        
+        def rebuild(use_co64):
+            # Rebuilt size does not depend on the offsets, so measure it with a no-op pass first
+            new_size = len(_rebuild_moov_atom(moov_data, lambda offset: offset, use_co64))
+            
+            def relocate(offset):
+                if insert_at <= offset < moov_offset:
+                    return offset + new_size
+                if offset >= moov_end:
+                    return offset + new_size - moov_size
+                return offset
+            
+            return _rebuild_moov_atom(moov_data, relocate, use_co64)
+        
+        try:
+            new_moov = rebuild(use_co64=False)
+        except OverflowError:
+            new_moov = rebuild(use_co64=True)
+        
+        with open(output_path, 'wb') as dst:
+            _copy_range(src, dst, 0, insert_at)
+            dst.write(new_moov)
+            _copy_range(src, dst, insert_at, moov_offset - insert_at)
+            _copy_range(src, dst, moov_end, file_size - moov_end)
+
+def _file_sha256(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def prepare_faststart(video_path, cache_dir=FASTSTART_CACHE_DIR):
+    """Return the path to upload for video_path, remuxing to faststart layout if needed
+    
+    Remuxed copies are cached by the SHA-256 of the source file, so a video is only
+    rewritten once. The original file is never modified.
+    """
+    suffix = Path(video_path).suffix.lower()
+    if suffix not in FASTSTART_EXTENSIONS:
+        return video_path
+    
+    try:
+        if not needs_faststart(video_path):
+            return video_path
+    except (ValueError, struct.error) as e:
+        print(f"Warning: Could not read MP4 layout of {video_path}: {e}")
+        return video_path
+    
+    cached_path = Path(cache_dir) / f"{_file_sha256(video_path)}{suffix}"
+    if cached_path.exists():
+        return str(cached_path)
+    
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = cached_path.with_name(f"{cached_path.name}.{os.getpid()}.tmp")
+    
+    try:
+        faststart_remux(video_path, temp_path)
+        os.replace(temp_path, cached_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+    
+    print(f"Remuxed {Path(video_path).name} to faststart layout")
+    return str(cached_path)
+
 class YouTubeUploader:
-    def __init__(self):
+    def __init__(self, authenticate=True):
         load_dotenv()
         self.scopes = ['https://www.googleapis.com/auth/youtube.upload']
         self.credentials_file = os.getenv('GOOGLE_CREDENTIALS_FILE', './credentials/client_secret.json')
         self.token_file = './credentials/token.pickle'
         
+        # HTTP transport tuning - one pool shared by all API clients in this process
+        self.http_pool_size = env_number('YAS_HTTP_POOL_SIZE', 10)
+        self.http_timeout = (
+            env_number('YAS_HTTP_CONNECT_TIMEOUT', 10.0, float),
+            env_number('YAS_HTTP_READ_TIMEOUT', 300.0, float)
+        )
+        
         # Create credentials directory if it doesn't exist
         os.makedirs('./credentials', exist_ok=True)
         
-        self.youtube = self._authenticate()
+        # The coordinator only reads and writes manifests, so it can run without API access
+        self.youtube = self._authenticate() if authenticate else None
     
     def _authenticate(self):
         creds = None
@@ -55,7 +303,8 @@ class YouTubeUploader:
             with open(self.token_file, 'wb') as token:
                 pickle.dump(creds, token)
         
-        return build('youtube', 'v3', credentials=creds)
+        http = PooledHttp(creds, get_shared_adapter(self.http_pool_size), self.http_timeout)
+        return build('youtube', 'v3', http=http)
     
     def extract_hashtags_from_description(self, description):
         """Extract hashtags from description text and return as list
@@ -197,6 +446,12 @@ class YouTubeUploader:
                     privacy_status = row.get('privacy', 'private').lower()
                     publish_at_raw = row.get('publishAt', '').strip()
                     
+                    # Optional priority column - higher numbers upload first in --all mode
+                    try:
+                        priority = int((row.get('priority') or '0').strip() or 0)
+                    except (ValueError, TypeError):
+                        priority = 0
+                    
                     # Check upload status - only include videos that haven't been uploaded (status = 0 or missing)
                     status = row.get('status', '0').strip()
                     # Convert to integer, default to 0 if not a valid number
@@ -225,6 +480,7 @@ class YouTubeUploader:
                         'privacy_status': privacy_status,
                         'publish_at': publish_at,
                         'playlist': row.get('playlist', '').strip(),
+                        'priority': priority,
                         'status': status_int,
                         # Keep legacy fields for backwards compatibility
                         'release_date': row.get('release_date', '').strip(),
@@ -386,8 +642,9 @@ class YouTubeUploader:
         for i, line in enumerate(lines):
             # Check if this line contains our filename and ends with status 0
             if video_filename.strip() in line and line.strip().endswith(',0'):
-                # Replace only the final ,0 with ,1 (or specified status)
-                lines[i] = line.rstrip().replace(',0', f',{status}') + '\n'
+                # Replace only the final ,0 with ,1 (or specified status) - earlier
+                # fields such as dates or a priority of 0 must stay untouched
+                lines[i] = line.rstrip()[:-2] + f',{status}' + '\n'
                 updated = True
                 break
         
@@ -400,9 +657,128 @@ class YouTubeUploader:
 
         return True
 
-    def upload_from_manifest(self, manifest_path, video_directory=None):
+    def upload_from_manifest(self, manifest_path, video_directory=None, faststart=False):
         videos_metadata = self.parse_manifest(manifest_path)
+        queue = ((manifest_path, metadata) for metadata in videos_metadata)
         
+        return self._upload_queue(queue, video_directory, faststart)
+    
+    def _publish_sort_key(self, publish_at):
+        """Sort key for a publish time - scheduled videos first (soonest first), unscheduled last"""
+        if not publish_at:
+            return (1, 0)
+        try:
+            return (0, datetime.fromisoformat(publish_at.replace('Z', '+00:00')).timestamp())
+        except ValueError:
+            return (1, 0)
+    
+    def build_priority_queue(self, manifest_directory="./video_lists/"):
+        """Merge the pending rows of every CSV manifest into a single heap
+        
+        Rows are ordered by the optional priority column (higher first), then by
+        publishAt (soonest first). Ties keep file order. Each entry remembers its
+        source manifest so the upload status can be written back to the right file.
+        """
+        manifest_dir = Path(manifest_directory)
+        
+        if not manifest_dir.exists():
+            raise FileNotFoundError(f"Video list directory not found: {manifest_dir}")
+        
+        heap = []
+        sequence = 0
+        
+        for manifest_file in sorted(manifest_dir.glob("*.csv")):
+            try:
+                videos = self.parse_manifest(str(manifest_file))
+            except Exception as e:
+                print(f"Warning: Skipping {manifest_file.name}: {e}")
+                continue
+            
+            for metadata in videos:
+                # sequence is unique, so the metadata dicts themselves are never compared
+                heapq.heappush(heap, (
+                    -metadata.get('priority', 0),
+                    self._publish_sort_key(metadata.get('publish_at')),
+                    sequence,
+                    str(manifest_file),
+                    metadata
+                ))
+                sequence += 1
+        
+        return heap
+    
+    def iter_all_manifests(self, manifest_directory="./video_lists/"):
+        """Yield (manifest_path, metadata) pairs from every manifest in global priority order"""
+        heap = self.build_priority_queue(manifest_directory)
+        
+        print(f"Found {len(heap)} pending videos across all video lists")
+        
+        while heap:
+            entry = heapq.heappop(heap)
+            yield entry[3], entry[4]
+    
+    def upload_all_manifests(self, video_directory=None, manifest_directory="./video_lists/", faststart=False):
+        """Upload pending videos from every manifest in one global priority order"""
+        return self._upload_queue(self.iter_all_manifests(manifest_directory), video_directory, faststart)
+    
+    def _reconnect_if_needed(self, upload_count):
+        """Re-authenticate after every 14 uploads
+        
+        Returns the new upload count, or None if reconnecting failed.
+        """
+        if upload_count < 14:
+            return upload_count
+        
+        print(f"\nReached upload limit of 14. Reconnecting to YouTube API...")
+        try:
+            self.youtube = self._authenticate()
+            print("Successfully reconnected to YouTube API.")
+            return 0
+        except Exception as e:
+            print(f"Failed to reconnect: {e}")
+            return None
+    
+    def _upload_video(self, video_path, metadata, upload_path=None):
+        """Upload a single manifest row that has already been located on disk
+        
+        upload_path overrides the file that is sent, e.g. a faststart copy of video_path.
+        """
+        # Handle publish time - use publishAt if available, otherwise parse legacy format
+        publish_at = (metadata.get('publish_at') or '').strip()
+        if not publish_at and metadata.get('release_date') and metadata.get('release_time'):
+            publish_at = self.parse_datetime(metadata['release_date'], metadata['release_time'])
+        
+        privacy_status = metadata.get('privacy_status', 'private')
+        playlist = metadata.get('playlist', '').strip()
+        
+        print(f"\nUploading: {metadata['title']}")
+        print(f"Video file: {video_path}")
+        if upload_path and str(upload_path) != str(video_path):
+            print(f"Uploading faststart copy: {upload_path}")
+        print(f"Privacy: {privacy_status}")
+        print(f"Status: Not uploaded (0) - proceeding with upload")
+        if publish_at:
+            print(f"Scheduled for: {publish_at}")
+        if playlist:
+            print(f"Playlist: {playlist}")
+            print("Note: Playlist functionality not yet implemented - video will upload without playlist assignment")
+        
+        return self.upload_short(
+            video_path=str(upload_path or video_path),
+            title=metadata['title'],
+            description=metadata['description'],
+            tags=metadata['tags'],
+            privacy_status=privacy_status,
+            publish_at=publish_at,
+            playlist=playlist
+        )
+    
+    def _upload_queue(self, queue, video_directory=None, faststart=False):
+        """Upload (manifest_path, metadata) pairs in order, writing status back to each source manifest
+        
+        With faststart enabled, every file is remuxed in a process pool up front so the
+        faststart copy is usually ready by the time its upload comes around.
+        """
         # Default to ./videos/ subdirectory if not specified
         if video_directory is None:
             video_directory = "./videos/"
@@ -412,71 +788,166 @@ class YouTubeUploader:
         results = []
         upload_count = 0
         
-        for metadata in videos_metadata:
-            # Check if we need to reconnect after 14 uploads
-            if upload_count >= 14:
-                print(f"\nReached upload limit of 14. Reconnecting to YouTube API...")
-                try:
-                    self.youtube = self._authenticate()
-                    upload_count = 0
-                    print("Successfully reconnected to YouTube API.")
-                except Exception as e:
-                    print(f"Failed to reconnect: {e}")
+        pool = None
+        prepared = {}
+        if faststart:
+            queue = list(queue)
+            pool = ProcessPoolExecutor()
+            for _, metadata in queue:
+                video_path = video_dir / metadata['video_filename']
+                if video_path.exists() and str(video_path) not in prepared:
+                    prepared[str(video_path)] = pool.submit(prepare_faststart, str(video_path))
+        
+        try:
+            for manifest_path, metadata in queue:
+                # Check if we need to reconnect after 14 uploads
+                upload_count = self._reconnect_if_needed(upload_count)
+                if upload_count is None:
                     break
+                
+                # Look for the exact video filename specified in the manifest
+                video_path = video_dir / metadata['video_filename']
+                
+                if not video_path.exists():
+                    print(f"Warning: Video file not found: {video_path}")
+                    continue
+                
+                upload_path = None
+                if str(video_path) in prepared:
+                    try:
+                        upload_path = prepared[str(video_path)].result()
+                    except Exception as e:
+                        print(f"Warning: Faststart remux failed for {video_path}, uploading original: {e}")
+                
+                result = self._upload_video(video_path, metadata, upload_path)
+                
+                if result:
+                    # Update status to 1 (uploaded) in the manifest file
+                    if self.update_manifest_status(manifest_path, metadata['video_filename'], 1):
+                        print(f"Status updated to uploaded (1) in manifest file")
+                    else:
+                        print(f"Warning: Could not update status in manifest file")
+                    
+                    result.update({
+                        'release_date': metadata.get('release_date'),
+                        'release_time': metadata.get('release_time')
+                    })
+                    results.append(result)
+                    upload_count += 1
+                else:
+                    print(f"Failed to upload: {metadata['title']}")
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+        
+        return results
+    
+    def run_worker(self, coordinator_url, video_directory=None, faststart=False):
+        """Pull assignments from a coordinator, upload them from shared storage and report back
+        
+        The coordinator owns manifest status and quota, so the worker never touches
+        manifest files. Returns the list of successful uploads made by this worker.
+        """
+        if video_directory is None:
+            video_directory = "./videos/"
+        
+        video_dir = Path(video_directory)
+        coordinator_url = coordinator_url.rstrip('/')
+        worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        
+        results = []
+        upload_count = 0
+        
+        print(f"Worker {worker_id} pulling assignments from {coordinator_url}")
+        
+        while True:
+            upload_count = self._reconnect_if_needed(upload_count)
+            if upload_count is None:
+                break
             
-            # Look for the exact video filename specified in the manifest
-            video_path = video_dir / metadata['video_filename']
+            assignment = self._coordinator_call_with_retry(coordinator_url, '/next', {'worker': worker_id})
             
-            if not video_path.exists():
-                print(f"Warning: Video file not found: {video_path}")
+            if assignment is None:
+                print("Error: Coordinator unreachable, stopping worker.")
+                break
+            
+            if assignment.get('done'):
+                print(f"\nCoordinator has no more work: {assignment.get('reason', 'queue drained')}")
+                break
+            
+            if assignment.get('wait'):
+                # Other workers still hold leases that may be handed back
+                time.sleep(COORDINATOR_POLL_SECONDS)
                 continue
             
-            # Handle publish time - use publishAt if available, otherwise parse legacy format
-            publish_at = metadata.get('publish_at', '').strip()
-            if not publish_at and metadata.get('release_date') and metadata.get('release_time'):
-                publish_at = self.parse_datetime(metadata['release_date'], metadata['release_time'])
-            
-            privacy_status = metadata.get('privacy_status', 'private')
-            playlist = metadata.get('playlist', '').strip()
-            
-            print(f"\nUploading: {metadata['title']}")
-            print(f"Video file: {video_path}")
-            print(f"Privacy: {privacy_status}")
-            print(f"Status: Not uploaded (0) - proceeding with upload")
-            if publish_at:
-                print(f"Scheduled for: {publish_at}")
-            if playlist:
-                print(f"Playlist: {playlist}")
-                print("Note: Playlist functionality not yet implemented - video will upload without playlist assignment")
-            
-            result = self.upload_short(
-                video_path=str(video_path),
-                title=metadata['title'],
-                description=metadata['description'],
-                tags=metadata['tags'],
-                privacy_status=privacy_status,
-                publish_at=publish_at,
-                playlist=playlist
-            )
+            metadata = assignment['metadata']
+            video_path = video_dir / metadata['video_filename']
+            report = {'id': assignment['id'], 'worker': worker_id, 'video_filename': metadata['video_filename']}
             
-            if result:
-                # Update status to 1 (uploaded) in the manifest file
-                if self.update_manifest_status(manifest_path, metadata['video_filename'], 1):
-                    print(f"Status updated to uploaded (1) in manifest file")
-                else:
-                    print(f"Warning: Could not update status in manifest file")
-                
-                result.update({
-                    'release_date': metadata.get('release_date'),
-                    'release_time': metadata.get('release_time')
-                })
-                results.append(result)
-                upload_count += 1
+            if not video_path.exists():
+                print(f"Warning: Video file not found: {video_path}")
+                report['skipped'] = True
             else:
-                print(f"Failed to upload: {metadata['title']}")
+                upload_path = None
+                if faststart:
+                    try:
+                        upload_path = prepare_faststart(str(video_path))
+                    except Exception as e:
+                        print(f"Warning: Faststart remux failed for {video_path}, uploading original: {e}")
+                
+                result = self._upload_video(video_path, metadata, upload_path)
+                report['result'] = result
+                
+                if result:
+                    results.append(result)
+                    upload_count += 1
+                else:
+                    print(f"Failed to upload: {metadata['title']}")
+            
+            if not self._report_to_coordinator(coordinator_url, report):
+                # Stop rather than pull more work the coordinator cannot hear about
+                break
         
         return results
     
+    def _report_to_coordinator(self, coordinator_url, report):
+        """Send an upload result to the coordinator, retrying with backoff
+        
+        A lost report means the row is handed out again and uploaded twice, so keep
+        trying for a few minutes and print the result for manual recovery if it fails.
+        """
+        if self._coordinator_call_with_retry(coordinator_url, '/result', report) is not None:
+            return True
+        
+        print("Error: Coordinator unreachable, result was not recorded:")
+        print(json.dumps(report, indent=2))
+        if report.get('result'):
+            print("Set this video's status to 1 in its manifest by hand to avoid a duplicate upload.")
+        return False
+    
+    def _coordinator_call_with_retry(self, coordinator_url, path, payload, attempts=8):
+        """Call the coordinator, retrying with exponential backoff (about two minutes in total)
+        
+        Returns the JSON reply, or None once every attempt has failed.
+        """
+        delay = 1
+        for attempt in range(1, attempts + 1):
+            try:
+                return self._coordinator_call(coordinator_url, path, payload)
+            except requests.RequestException as e:
+                if attempt == attempts:
+                    break
+                print(f"Coordinator call to {path} failed ({e}), retrying in {delay}s...")
+                time.sleep(delay)
+                delay = min(delay * 2, 60)
+        
+        return None
+    
+    def _coordinator_call(self, coordinator_url, path, payload):
+        response = requests.post(f"{coordinator_url}{path}", json=payload, timeout=30)
+        response.raise_for_status()
+        return response.json()
+    
     def generate_manifest(self, video_directory="./videos/", output_file=None):
         video_dir = Path(video_directory)
         
@@ -616,7 +1087,274 @@ class YouTubeUploader:
                 print("\nCancelled.")
                 return None
 
+# Each videos.insert call costs 1600 units of the YouTube Data API daily quota
+UPLOAD_QUOTA_COST = 1600
+
+# How long idle workers wait before asking the coordinator for work again
+COORDINATOR_POLL_SECONDS = 5
+
+class UploadCoordinator:
+    """Hands pending manifest rows to remote workers over a small JSON API
+    
+    Workers POST to /next for an assignment and to /result to report it. Assignments
+    are leased, so rows held by a worker that disappears go back to the queue. The
+    coordinator is the only process that writes manifest status or spends quota.
+    """
+    def __init__(self, uploader, queue, quota_units=10000, lease_seconds=3600):
+        self.uploader = uploader
+        self.quota_units = quota_units
+        self.lease_seconds = lease_seconds
+        self.quota_used = 0
+        self.results = []
+        
+        self.pending = deque()
+        for manifest_path, metadata in queue:
+            self.pending.append((uuid.uuid4().hex, manifest_path, metadata))
+        
+        self.leases = {}
+        # Leases that expired, keyed by their old ID, so a late report from the original worker still counts
+        self.expired = {}
+        self.lock = threading.Lock()
+        self.finished = threading.Event()
+        self._check_finished()
+    
+    def _check_finished(self):
+        if not self._in_flight() and (not self.pending or not self._quota_available()):
+            self.finished.set()
+    
+    def _in_flight(self):
+        """Number of uploads that may still be charged - live leases plus expired ones that never reported"""
+        unreported = sum(1 for expired in self.expired.values()
+                         if not expired['reported'] and not expired['abandoned'])
+        return len(self.leases) + unreported
+    
+    def _quota_available(self):
+        reserved = self._in_flight() * UPLOAD_QUOTA_COST
+        return self.quota_used + reserved + UPLOAD_QUOTA_COST <= self.quota_units
+    
+    def _requeue_expired(self):
+        now = time.time()
+        
+        for expired in self.expired.values():
+            if not expired['reported'] and not expired['abandoned'] and expired['expires'] <= now:
+                # The worker has been silent for two lease periods - assume its insert was charged
+                print(f"Giving up on {expired['metadata']['video_filename']} from {expired['worker']} - "
+                      f"counting its quota as spent")
+                expired['abandoned'] = True
+                self.quota_used += UPLOAD_QUOTA_COST
+        
+        for assignment_id, lease in list(self.leases.items()):
+            if lease['expires'] <= now:
+                print(f"Lease expired for {lease['metadata']['video_filename']} ({lease['worker']}) - requeueing")
+                del self.leases[assignment_id]
+                
+                # Requeue under a new ID so the old worker can never settle someone else's lease
+                new_id = uuid.uuid4().hex
+                self.expired[assignment_id] = {
+                    'manifest_path': lease['manifest_path'],
+                    'metadata': lease['metadata'],
+                    'worker': lease['worker'],
+                    'current_id': new_id,
+                    'reported': False,
+                    'abandoned': False,
+                    # Keep reserving quota for the old worker's insert for one more lease period
+                    'expires': now + self.lease_seconds
+                }
+                self.pending.appendleft((new_id, lease['manifest_path'], lease['metadata']))
+    
+    def _claim_expired(self, assignment_id, worker, skipped):
+        """Match a late report from a worker whose lease expired, or return None"""
+        expired = self.expired.get(assignment_id)
+        if expired is None or expired['worker'] != worker or expired['reported']:
+            return None
+        
+        expired['reported'] = True
+        if skipped:
+            # Nothing was uploaded, so the requeued row stays where it is
+            return expired
+        
+        # Follow the row to its current ID in case it expired more than once
+        current_id = expired['current_id']
+        while current_id in self.expired:
+            current_id = self.expired[current_id]['current_id']
+        
+        for entry in self.pending:
+            if entry[0] == current_id:
+                # Nobody has picked the row up again yet, so this report settles it
+                self.pending.remove(entry)
+                return expired
+        
+        print(f"Warning: {worker} reported {expired['metadata']['video_filename']} after its lease "
+              f"was handed to another worker - the video may have been uploaded twice")
+        return expired
+    
+    def next_assignment(self, worker):
+        with self.lock:
+            self._requeue_expired()
+            
+            if not self.pending:
+                if self._in_flight():
+                    return {'wait': True}
+                return {'done': True, 'reason': 'queue drained'}
+            
+            if not self._quota_available():
+                if self._in_flight():
+                    return {'wait': True}
+                return {'done': True, 'reason': 'quota budget exhausted'}
+            
+            assignment_id, manifest_path, metadata = self.pending.popleft()
+            self.leases[assignment_id] = {
+                'manifest_path': manifest_path,
+                'metadata': metadata,
+                'worker': worker,
+                'expires': time.time() + self.lease_seconds
+            }
+            
+            print(f"Assigned {metadata['video_filename']} to {worker}")
+            return {'id': assignment_id, 'metadata': metadata}
+    
+    def report_result(self, assignment_id, worker, result=None, skipped=False):
+        with self.lock:
+            lease = self.leases.get(assignment_id)
+            
+            if lease is not None and lease['worker'] == worker:
+                del self.leases[assignment_id]
+            else:
+                lease = self._claim_expired(assignment_id, worker, skipped)
+            
+            if lease is None:
+                print(f"Warning: Ignoring report for unknown assignment {assignment_id} from {worker}")
+                return False
+            
+            video_filename = lease['metadata']['video_filename']
+            
+            if skipped:
+                print(f"Warning: {worker} could not find video file: {video_filename}")
+                if lease.get('abandoned'):
+                    # Quota was counted as spent when the lease was given up on
+                    self.quota_used -= UPLOAD_QUOTA_COST
+            else:
+                # Failed inserts still count against the quota - abandoned leases were already charged
+                if not lease.get('abandoned'):
+                    self.quota_used += UPLOAD_QUOTA_COST
+                
+                if result:
+                    if self.uploader.update_manifest_status(lease['manifest_path'], video_filename, 1):
+                        print(f"{worker} uploaded {video_filename} - status updated to uploaded (1)")
+                    else:
+                        print(f"Warning: Could not update status in manifest file for {video_filename}")
+                    
+                    result.update({
+                        'release_date': lease['metadata'].get('release_date'),
+                        'release_time': lease['metadata'].get('release_time')
+                    })
+                    self.results.append(result)
+                else:
+                    print(f"{worker} failed to upload: {video_filename}")
+            
+            self._check_finished()
+            return True
+    
+    def status(self):
+        with self.lock:
+            return {
+                'pending': len(self.pending),
+                'leased': len(self.leases),
+                'uploaded': len(self.results),
+                'quota_used': self.quota_used,
+                'quota_units': self.quota_units
+            }
+    
+    def serve(self, host='127.0.0.1', port=8765):
+        """Serve assignments until every row is uploaded (or quota runs out) and return the results"""
+        coordinator = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def _send_json(self, payload, code=200):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def do_GET(self):
+                if self.path == '/status':
+                    self._send_json(coordinator.status())
+                else:
+                    self._send_json({'error': 'not found'}, 404)
+            
+            def do_POST(self):
+                try:
+                    length = int(self.headers.get('Content-Length', 0))
+                    payload = json.loads(self.rfile.read(length) or b'{}')
+                except ValueError:
+                    self._send_json({'error': 'invalid JSON'}, 400)
+                    return
+                
+                if not isinstance(payload, dict):
+                    self._send_json({'error': 'request body must be a JSON object'}, 400)
+                    return
+                
+                worker = payload.get('worker', self.client_address[0])
+                if not isinstance(worker, str):
+                    self._send_json({'error': 'worker must be a string'}, 400)
+                    return
+                
+                if self.path == '/next':
+                    self._send_json(coordinator.next_assignment(worker))
+                elif self.path == '/result':
+                    if not isinstance(payload.get('id'), str):
+                        self._send_json({'error': 'id must be a string'}, 400)
+                        return
+                    if not isinstance(payload.get('result'), (dict, type(None))):
+                        self._send_json({'error': 'result must be an object or null'}, 400)
+                        return
+                    
+                    accepted = coordinator.report_result(
+                        payload.get('id'),
+                        worker,
+                        result=payload.get('result'),
+                        skipped=payload.get('skipped', False)
+                    )
+                    self._send_json({'accepted': accepted})
+                else:
+                    self._send_json({'error': 'not found'}, 404)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        server = ThreadingHTTPServer((host, port), Handler)
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        
+        print(f"Coordinator listening on http://{host}:{server.server_address[1]}")
+        print(f"{len(self.pending)} videos queued, quota budget {self.quota_units} units")
+        
+        try:
+            # Wake up periodically so expired leases are noticed even if no worker is polling
+            while not self.finished.wait(COORDINATOR_POLL_SECONDS):
+                with self.lock:
+                    self._requeue_expired()
+                    self._check_finished()
+            
+            # Keep answering briefly so waiting workers hear that the queue is done
+            time.sleep(COORDINATOR_POLL_SECONDS * 2)
+        except KeyboardInterrupt:
+            print("\nCoordinator interrupted.")
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        print(f"Quota used: {self.quota_used} of {self.quota_units} units")
+        return self.results
+
 def main():
+    # Optional flag, accepted anywhere on the command line
+    faststart = "--faststart" in sys.argv
+    if faststart:
+        sys.argv.remove("--faststart")
+    
     if len(sys.argv) < 2:
         # Interactive mode - prompt user to select video list
         print("YouTube Auto Shorts (YAS) - Interactive Mode")
@@ -628,7 +1366,7 @@ def main():
             manifest_path = uploader.select_manifest_interactive()
             
             if manifest_path:
-                results = uploader.upload_from_manifest(manifest_path)
+                results = uploader.upload_from_manifest(manifest_path, faststart=faststart)
                 
                 if results:
                     print(f"\nBatch upload completed! {len(results)} videos uploaded successfully.")
@@ -651,21 +1389,34 @@ def main():
         print("  Interactive mode:  python yas.py")
         print("  Single upload:     python yas.py <video_path> <title> [description] [tags]")
         print("  Batch upload:      python yas.py --manifest <manifest_file> [video_directory]")
+        print("  Upload all lists:  python yas.py --all [video_directory]")
+        print("  Coordinator:       python yas.py --coordinator <manifest_file|--all> [host:port]")
+        print("  Worker:            python yas.py --worker <coordinator_url> [video_directory]")
         print("  Generate manifest: python yas.py --generate [video_directory] [output_file]")
         print("")
+        print("Add --faststart to single, interactive, manifest, --all or worker uploads to move a")
+        print("trailing MP4/MOV moov atom to the front first.")
+        print("")
         print("Examples:")
         print("  python yas.py")
         print("  python yas.py video.mp4 'My Short Video' 'Description here' 'tag1,tag2,tag3'")
         print("  python yas.py --manifest videos_08_20_25.md")
         print("  python yas.py --manifest ./video_lists/videos_08_20_25.md ./videos/")
+        print("  python yas.py --all")
+        print("  python yas.py --all --faststart")
+        print("  python yas.py --coordinator --all 0.0.0.0:8765")
+        print("  python yas.py --worker http://upload-host:8765 /mnt/shared/videos/")
         print("  python yas.py --generate")
         print("  python yas.py --generate ./my-videos/ ./video_lists/my_manifest.md")
         sys.exit(0)
     
     try:
-        uploader = YouTubeUploader()
+        uploader = YouTubeUploader(authenticate=sys.argv[1] != "--coordinator")
         
         if sys.argv[1] == "--generate":
+            if faststart:
+                print("Warning: --faststart has no effect when generating a manifest")
+            
             video_directory = sys.argv[2] if len(sys.argv) > 2 else "./videos/"
             output_file = sys.argv[3] if len(sys.argv) > 3 else None
             
@@ -693,7 +1444,7 @@ def main():
             
             video_directory = sys.argv[3] if len(sys.argv) > 3 else None
             
-            results = uploader.upload_from_manifest(manifest_path, video_directory)
+            results = uploader.upload_from_manifest(manifest_path, video_directory, faststart)
             
             if results:
                 print(f"\nBatch upload completed! {len(results)} videos uploaded successfully.")
@@ -701,6 +1452,66 @@ def main():
                 print("\nBatch upload failed or no videos were uploaded!")
                 sys.exit(1)
         
+        elif sys.argv[1] == "--all":
+            video_directory = sys.argv[2] if len(sys.argv) > 2 else None
+            
+            results = uploader.upload_all_manifests(video_directory, faststart=faststart)
+            
+            if results:
+                print(f"\nBatch upload completed! {len(results)} videos uploaded successfully.")
+            else:
+                print("\nBatch upload failed or no videos were uploaded!")
+                sys.exit(1)
+        
+        elif sys.argv[1] == "--coordinator":
+            if faststart:
+                print("Warning: --faststart has no effect on the coordinator - pass it to each --worker instead")
+            
+            if len(sys.argv) < 3:
+                print("Error: Manifest file path or --all required")
+                sys.exit(1)
+            
+            if sys.argv[2] == "--all":
+                queue = uploader.iter_all_manifests()
+            else:
+                manifest_file = sys.argv[2]
+                
+                # If just filename given, look in ./video_lists/ directory
+                if "/" not in manifest_file:
+                    manifest_path = f"./video_lists/{manifest_file}"
+                else:
+                    manifest_path = manifest_file
+                
+                queue = ((manifest_path, metadata) for metadata in uploader.parse_manifest(manifest_path))
+            
+            address = sys.argv[3] if len(sys.argv) > 3 else "127.0.0.1:8765"
+            host, _, port = address.rpartition(':')
+            
+            coordinator = UploadCoordinator(
+                uploader,
+                queue,
+                quota_units=env_number('YAS_QUOTA_UNITS', 10000),
+                lease_seconds=env_number('YAS_LEASE_SECONDS', 3600)
+            )
+            results = coordinator.serve(host or "127.0.0.1", int(port))
+            
+            if results:
+                print(f"\nBatch upload completed! {len(results)} videos uploaded successfully.")
+            else:
+                print("\nBatch upload failed or no videos were uploaded!")
+                sys.exit(1)
+        
+        elif sys.argv[1] == "--worker":
+            if len(sys.argv) < 3:
+                print("Error: Coordinator URL required")
+                sys.exit(1)
+            
+            video_directory = sys.argv[3] if len(sys.argv) > 3 else None
+            
+            results = uploader.run_worker(sys.argv[2], video_directory, faststart)
+            
+            print(f"\nWorker finished! {len(results)} videos uploaded by this worker.")
+        
         else:
             if len(sys.argv) < 3:
                 print("Error: Both video path and title are required for single upload")
@@ -711,6 +1522,12 @@ def main():
             description = sys.argv[3] if len(sys.argv) > 3 else ""
             tags = sys.argv[4].split(',') if len(sys.argv) > 4 and sys.argv[4] else []
             
+            if faststart and os.path.exists(video_path):
+                try:
+                    video_path = prepare_faststart(video_path)
+                except Exception as e:
+                    print(f"Warning: Faststart remux failed for {video_path}, uploading original: {e}")
+            
             result = uploader.upload_short(
                 video_path=video_path,
                 title=title,